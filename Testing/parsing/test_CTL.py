@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+from eBCSgen.Parsing.ParseCTLformula import CTLparser
+from eBCSgen.utils import lark_cache_file
+
+parser = CTLparser()
+
+def test_parse():
+    formula = "E(F([Y()::rep > 1]))"
+    assert parser.parse(formula).success
+    formula = "A(G([T(P{m})::x >= 2] & [T(P{i})::x = 0]))"
+    assert parser.parse(formula).success
+    formula = "E(F(Y()::rep > 1))"
+    assert not parser.parse(formula).success
+
+
+def test_parse_cached():
+    # grammar of the second parser is loaded from the cache written by the first one
+    assert os.path.exists(lark_cache_file("ctl"))
+
+    cached_parser = CTLparser()
+    formula = "E(F([Y()::rep > 1]))"
+    assert str(cached_parser.parse(formula)) == str(parser.parse(formula))
@@ -1,6 +1,10 @@
+import os
+import stat
+
 import pytest
 
 from eBCSgen.Parsing.ParsePCTLformula import PCTLparser
+from eBCSgen.utils import lark_cache_file
 
 parser = PCTLparser()
 
@@ -14,4 +18,16 @@ def test_parse():
     formula = "P > 0.5 [F T(P{m})::x < 2 & ( T(P{m})::x = 0 | T()::x >= 7)]"
     assert parser.parse(formula).success
     formula = "P < 0.5 [G (T(P{m})::x = 2 & T(P{m})::x = 0) | (T(P{m})::x <= 2 & T(P{m})::x >= 0) ]"
-    assert parser.parse(formula).success
\ No newline at end of file
+    assert parser.parse(formula).success
+
+
+def test_parse_cached():
+    # grammar of the second parser is loaded from the cache written by the first one
+    cache_file = lark_cache_file("pctl")
+    assert os.path.exists(cache_file)
+    assert stat.S_IMODE(os.stat(os.path.dirname(cache_file)).st_mode) == 0o700
+
+    cached_parser = PCTLparser()
+    formula = "P =? [F T(P{m})::x >= 2 & T(P{i})::x = 0]"
+    assert str(cached_parser.parse(formula)) == str(parser.parse(formula))
+    assert not cached_parser.parse("P =? [F T(P{m})::x >=]").success
@@ -2,6 +2,7 @@ import collections
 import pytest
 
 from eBCSgen.Core.Model import Model
+from eBCSgen.Parsing.ParseBCSL import Parser
 
 from Testing.models.get_model_str import get_model_str
 import Testing.objects_testing as objects
@@ -33,6 +34,11 @@ def test_parser():
     assert objects.model_parser.parse(model_str_1).data == model
 
 
+def test_parser_shared_grammar():
+    assert Parser("model").parser is objects.model_parser.parser
+    assert Parser("rate_complex").parser is not objects.model_parser.parser
+
+
 def test_parser_errors():
     assert not objects.model_parser.parse(model_wrong_1).success
 
@@ -2,6 +2,7 @@ import unittest
 import numpy as np
 
 from eBCSgen.Core.Complex import Complex
+from eBCSgen.Core.Formula import AtomicProposition
 from eBCSgen.Core.Structure import StructureAgent
 from eBCSgen.TS.Edge import Edge
 from eBCSgen.TS.State import State, Vector, Memory
@@ -105,3 +106,16 @@ class TestTransitionSystem(unittest.TestCase):
         new_hell = State(Vector(np.array([5, 5, 5])), Memory(0), True)
         new_encoding = {1: self.s1, 2: self.s2, 0: self.s3, 3: new_hell}
         self.assertEqual(ts.states_encoding, new_encoding)
+
+    def test_create_AP_labels_hell(self):
+        ts = TransitionSystem((objects.c27, objects.c28, objects.c29), 5)
+        ts.states_encoding = {1: self.s1, 2: self.s4, 3: self.hell}
+        ts.init = 1
+
+        ap = AtomicProposition(objects.c27, " >= ", 1)
+        state_labels, AP_labels = ts.create_AP_labels([ap], include_init=False)
+        self.assertEqual(state_labels, {1: {"property_0"}, 2: {"property_0"}})
+
+        ap = AtomicProposition(objects.c27, " = ", "4")
+        state_labels, AP_labels = ts.create_AP_labels([ap], include_init=False)
+        self.assertEqual(state_labels, {2: {"property_0"}})
@@ -1,4 +1,7 @@
+import copy
 import unittest
+
+from eBCSgen.Core.Atomic import AtomicAgent
 import Testing.objects_testing as objects
 
 
@@ -39,3 +42,13 @@ class TestAtomic(unittest.TestCase):
     def test_replace(self):
         self.assertEqual(objects.a4.replace(objects.a6), objects.a6)
         self.assertEqual(objects.a6.replace(objects.a7), objects.a6)
+
+    def test_hash(self):
+        self.assertEqual(hash(objects.a1), hash(objects.a8))
+        self.assertEqual(len({objects.a1, objects.a8, objects.a4}), 2)
+        self.assertEqual(hash(copy.deepcopy(objects.a1)), hash(objects.a1))
+
+    def test_get(self):
+        self.assertIs(AtomicAgent.get("T", "s"), AtomicAgent.get("T", "s"))
+        self.assertEqual(AtomicAgent.get("T", "s"), objects.a1)
+        self.assertIs(objects.a1.reduce_context(), objects.a4.reduce_context())
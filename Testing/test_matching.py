@@ -0,0 +1,13 @@
+import unittest
+
+from eBCSgen.Core.Matching import enumerate_matches
+
+
+class TestMatching(unittest.TestCase):
+    def test_enumerate_matches(self):
+        self.assertEqual(enumerate_matches([], [1, 2]), [()])
+        self.assertEqual(enumerate_matches([[0], []], [1]), [])
+
+        self.assertEqual(sorted(enumerate_matches([[0, 1], [0, 1]], [1, 1])), [(0, 1), (1, 0)])
+        self.assertEqual(sorted(enumerate_matches([[0, 1], [0, 1]], [2, 1])), [(0, 0), (0, 1), (1, 0)])
+        self.assertEqual(enumerate_matches([[0], [0]], [1]), [])
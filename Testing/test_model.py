@@ -1,5 +1,6 @@
 import unittest
 import collections
+import io
 from unittest import mock
 from lark import Tree
 
@@ -97,6 +98,22 @@ class TestModel(unittest.TestCase):
         parsed_again = objects.model_parser.parse(back_to_str).data
         self.assertEqual(model, parsed_again)
 
+    def test_write_to(self):
+        model = objects.model_parser.parse(self.model_str_1).data
+        output = io.StringIO()
+        model.write_to(output)
+        self.assertEqual(output.getvalue(), repr(model))
+        self.assertEqual(objects.model_parser.parse(output.getvalue()).data, model)
+
+    def test_labelled_rules(self):
+        model_str = "#! rules\n" \
+                    "r1 ~ K(S{i})::cyt => K(S{a})::cyt @ 2*[K()::cyt]\n" \
+                    "r2 ~ K(S{i})::cyt => K(S{a})::cyt @ 2*[K()::cyt]\n\n" \
+                    "#! inits\n" \
+                    "2 K(S{i})::cyt"
+        model = objects.model_parser.parse(model_str).data
+        self.assertEqual({rule.label for rule in model.rules}, {"r1", "r2"})
+
     def test_signatures(self):
         model = objects.model_parser.parse(self.model_str_2).data
         self.assertEqual(model.atomic_signature, {'K': {'c', 'i', 'p'}, 'T': {'e', 'a', 'o', 'j'},
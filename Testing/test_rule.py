@@ -1,6 +1,10 @@
 import unittest
+import collections
+import pickle
 
+from eBCSgen.Core.Rate import Rate
 from eBCSgen.Core.Rule import Rule
+from eBCSgen.TS.State import State, Memory, Multiset
 
 import Testing.objects_testing as objects
 
@@ -10,6 +14,24 @@ class TestRule(unittest.TestCase):
     def test_eq(self):
         self.assertEqual(objects.r4, objects.r4)
 
+    def test_hash(self):
+        rule_expr = "K()::cyt => K(S{a})::cyt @ 2*[K()::cyt]"
+        rule_1 = objects.rule_parser.parse("r1 ~ " + rule_expr).data[1]
+        rule_2 = objects.rule_parser.parse("r1 ~ " + rule_expr).data[1]
+        self.assertEqual(hash(rule_1), hash(rule_2))
+
+        # rules differing only in label are kept apart
+        rule_3 = objects.rule_parser.parse("r2 ~ " + rule_expr).data[1]
+        self.assertNotEqual(hash(rule_1), hash(rule_3))
+        self.assertEqual(len({rule_1, rule_3}), 2)
+
+        rule_2.rate = Rate(objects.rate_parser.parse("5*[K()::cyt]").data)
+        self.assertNotEqual(rule_1, rule_2)
+        self.assertNotEqual(hash(rule_1), hash(rule_2))
+
+        copied = pickle.loads(pickle.dumps(rule_1))
+        self.assertEqual(hash(copied), hash(rule_1))
+
     def test_print(self):
         self.assertEqual(str(objects.r4), "K(S{u}).B()::cyt => K(S{p})::cyt + B()::cyt @ 3.0*[K()::cyt]/2.0*v_1")
         self.assertEqual(str(objects.r5),
@@ -102,3 +124,32 @@ class TestRule(unittest.TestCase):
         rule = objects.rule_parser.parse(rule_expr).data[1]
 
         self.assertTrue(rule.exists_compatible_agent(complex))
+
+    def test_match(self):
+        rule_expr = "K()::cyt + K()::cyt => K().K()::cyt"
+        rule = objects.rule_parser.parse(rule_expr).data[1]
+        rule.lhs, rule.rhs = rule.create_complexes()
+
+        complex_1 = objects.rate_complex_parser.parse("K(S{a})::cyt").data.children[0]
+        complex_2 = objects.rate_complex_parser.parse("K(S{i})::cyt").data.children[0]
+        state = State(Multiset(collections.Counter({complex_1: 1, complex_2: 1})), Memory(0))
+
+        matches = rule.match(state, all=True)
+        self.assertEqual(len(matches), 2)
+        self.assertIn(complex_1.agents + complex_2.agents, matches)
+        self.assertIn(complex_2.agents + complex_1.agents, matches)
+        self.assertEqual(state.content.value, collections.Counter({complex_1: 1, complex_2: 1}))
+
+        state = State(Multiset(collections.Counter({complex_1: 1})), Memory(0))
+        self.assertIsNone(rule.match(state))
+
+    def test_evaluate_rate(self):
+        rule_expr = "K()::cyt => K(S{a})::cyt @ 2*[K()::cyt]"
+        rule = objects.rule_parser.parse(rule_expr).data[1]
+
+        complex = objects.rate_complex_parser.parse("K(S{i})::cyt").data.children[0]
+        state = State(Multiset(collections.Counter({complex: 3})), Memory(0))
+        self.assertEqual(float(rule.evaluate_rate(state, dict())), 6)
+
+        rule.rate = Rate(objects.rate_parser.parse("5*[K()::cyt]").data)
+        self.assertEqual(float(rule.evaluate_rate(state, dict())), 15)
@@ -2,6 +2,7 @@ import unittest
 import collections
 import numpy as np
 
+from eBCSgen.Core.Side import Side
 from eBCSgen.TS.State import State, Memory, Vector
 
 import Testing.objects_testing as objects
@@ -20,6 +21,11 @@ class TestSide(unittest.TestCase):
         ordering = (objects.counter_c1, objects.counter_c2, objects.counter_c3, objects.counter_c4)
         self.assertEqual(objects.side7.to_vector(ordering), State(Vector(np.array((0, 1, 1, 1))), Memory(0)))
 
+    def test_counter_to_vector(self):
+        index_of = {objects.counter_c1: 0, objects.counter_c2: 1, objects.counter_c3: 2, objects.counter_c4: 3}
+        counter = collections.Counter({objects.counter_c2: 1000, objects.counter_c4: 3})
+        self.assertEqual(Side.counter_to_vector(counter, index_of), State(Vector(np.array((0, 1000, 0, 3))), Memory(0)))
+
     def test_compatible(self):
         self.assertTrue(objects.side10.compatible(objects.side9))
         self.assertTrue(objects.side10.compatible(objects.side12))
@@ -1,10 +1,16 @@
+import os
+import shutil
 import subprocess
+import tempfile
 from pandas import DataFrame
 
 from eBCSgen.TS.TransitionSystem import TransitionSystem
 from eBCSgen.Core.Formula import Formula
 from eBCSgen.Errors.StormNotAvailable import StormNotAvailable
 
+# Storm executables are located once at import instead of probing them before each call
+STORM_PATHS = {name: shutil.which(name) for name in ("storm", "storm-pars")}
+
 
 class PCTL:
     @staticmethod
@@ -20,17 +26,18 @@ class PCTL:
         :param PCTL_formula: given PCTL formula
         :return: output of Storm model checker
         """
-        path = "/tmp/"
         # generate labels and give them to save_storm
         APs = PCTL_formula.get_APs()
         state_labels, AP_labels = ts.create_AP_labels(APs)
         formula = PCTL_formula.replace_APs(AP_labels)
-        transitions_file = path + "exp_transitions.tra"
-        labels_file = path + "exp_labels.lab"
-        ts.save_to_STORM_explicit(transitions_file, labels_file, state_labels, AP_labels)
 
-        command = "storm --explicit {0} {1} --prop '{2}'"
-        result = call_storm(command.format(transitions_file, labels_file, formula))
+        # private directory, so concurrent calls do not overwrite each other's files
+        with tempfile.TemporaryDirectory() as path:
+            transitions_file = os.path.join(path, "exp_transitions.tra")
+            labels_file = os.path.join(path, "exp_labels.lab")
+            ts.save_to_STORM_explicit(transitions_file, labels_file, state_labels, AP_labels)
+
+            result = call_storm(["storm", "--explicit", transitions_file, labels_file, "--prop", str(formula)])
         return result
 
     @staticmethod
@@ -47,22 +54,17 @@ class PCTL:
         :param region: string representation of region which will be checked by Storm
         :return: output of Storm model checker
         """
-        path = "/tmp/"
-
         labels, prism_formulas = PCTL_formula.create_complex_labels(ts.ordering)
         formula = PCTL_formula.replace_complexes(labels)
 
-        prism_file = path + "prism-parametric.pm"
-
-        ts.save_to_prism(prism_file, ts.params, prism_formulas)
-
-        command_region = "storm-pars --prism {0} --prop '{1}' --region '{2}' --refine 0.01 10 --printfullresult"
-        command_no_region = "storm-pars --prism {0} --prop '{1}'"
+        with tempfile.TemporaryDirectory() as path:
+            prism_file = os.path.join(path, "prism-parametric.pm")
+            ts.save_to_prism(prism_file, ts.params, prism_formulas)
 
-        if region:
-            result = call_storm(command_region.format(prism_file, formula, region))
-        else:
-            result = call_storm(command_no_region.format(prism_file, formula))
+            command = ["storm-pars", "--prism", prism_file, "--prop", str(formula)]
+            if region:
+                command += ["--region", region, "--refine", "0.01", "10", "--printfullresult"]
+            result = call_storm(command)
         return result
 
     @staticmethod
@@ -92,17 +94,15 @@ class PCTL:
         return DataFrame(rows, columns=columns)
 
 
-def call_storm(command: str):
+def call_storm(command: list):
     """
     Calls Storm model checker locally.
 
-    :param command: given command to be executed
+    :param command: given command to be executed, starting with name of Storm executable
     :return: result of Storm execution
     """
-    status, result = subprocess.getstatusoutput('storm')
-    if status == 0:
-        command = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, shell=True)
-        stdout, stderr = command.communicate()
-        return stdout
-    else:
+    executable = STORM_PATHS.get(command[0])
+    if executable is None:
         raise StormNotAvailable
+    result = subprocess.run([executable] + command[1:], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return result.stdout
@@ -1,24 +1,50 @@
+import functools
+
+
 class AtomicAgent:
+    __slots__ = ("name", "state", "_str", "_hash")
+
     def __init__(self, name: str, state: str):
         self.name = name
         self.state = state
+        # agents are never changed after creation, so string form and hash are computed only once
+        self._str = name + "{" + state + "}"
+        self._hash = hash((name, state))
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get(cls, name: str, state: str) -> 'AtomicAgent':
+        """
+        Returns shared instance of AtomicAgent with given name and state (flyweight).
+
+        :param name: name of the agent
+        :param state: state of the agent
+        :return: interned AtomicAgent
+        """
+        return cls(name, state)
+
+    def __reduce__(self):
+        # cached hash must not survive pickling (string hashes differ across processes)
+        return AtomicAgent, (self.name, self.state)
 
     def __repr__(self):
-        return str(self)
+        return self._str
 
     def __str__(self):
-        return self.name + "{" + self.state + "}"
+        return self._str
 
     def __lt__(self, other: 'AtomicAgent'):
         return self.name < other.name
 
     def __eq__(self, other: 'AtomicAgent'):
+        if self is other:
+            return True
         if type(self) != type(other):
             return False
         return self.name == other.name and self.state == other.state
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
 
     def compatible(self, other: 'AtomicAgent') -> bool:
         """
@@ -31,17 +57,15 @@ class AtomicAgent:
             return False
         return (self == other) or (self.name == other.name and self.state == "_")
 
-    def extend_signature(self, atomic_signature: dict, structure_signature: dict):
+    def update_signature(self, atomic_signature: dict, structure_signature: dict):
         """
-        Extend given signatures by possibly new context.
+        Extend given signatures (in place) by possibly new context.
 
         :param atomic_signature: given atomic signature
         :param structure_signature: given structure signature
-        :return: updated signatures
         """
         if self.state != "_":
-            atomic_signature[self.name] = atomic_signature.get(self.name, set()) | {self.state}
-        return atomic_signature, structure_signature
+            atomic_signature.setdefault(self.name, set()).add(self.state)
 
     def add_context(self, other, atomic_signature: dict, structure_signature: dict) -> set:
         """
@@ -64,7 +88,8 @@ class AtomicAgent:
             if self.state == "_" and other.state == "_":
                 result = set()
                 for state in atomic_signature[self.name]:
-                    result.add((AtomicAgent(str(self.name), state), AtomicAgent(str(self.name), state)))
+                    agent = AtomicAgent.get(self.name, state)
+                    result.add((agent, agent))
                 return result
             else:
                 return {(self, other)}
@@ -73,13 +98,13 @@ class AtomicAgent:
         if other == -1:
             if self.state == "_":
                 for state in atomic_signature[self.name]:
-                    result.add((None, AtomicAgent(str(self.name), state)))
+                    result.add((None, AtomicAgent.get(self.name, state)))
             else:
                 result = {(None, self)}
         elif other == 1:
             if self.state == "_":
                 for state in atomic_signature[self.name]:
-                    result.add((AtomicAgent(str(self.name), state), None))
+                    result.add((AtomicAgent.get(self.name, state), None))
             else:
                 result = {(self, None)}
         else:
@@ -92,7 +117,7 @@ class AtomicAgent:
 
         :return: new AtomicAgent with reduced context
         """
-        return AtomicAgent(self.name, "_")
+        return AtomicAgent.get(self.name, "_")
 
     def replace(self, agent):
         """
@@ -102,5 +127,5 @@ class AtomicAgent:
         :return: changed agent
         """
         if self.state == "_":
-            return AtomicAgent(self.name, agent.state)
-        return AtomicAgent(self.name, self.state)
+            return AtomicAgent.get(self.name, agent.state)
+        return self
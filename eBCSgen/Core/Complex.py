@@ -20,6 +20,8 @@ class Complex:
         return repr(self) < repr(other)
 
     def __eq__(self, other: 'Complex'):
+        if self is other:
+            return True
         return self.compartment == other.compartment and\
                collections.Counter(self.agents) == collections.Counter(other.agents)
 
@@ -77,17 +79,15 @@ class Complex:
         """
         return len(self.agents) > 1
 
-    def extend_signature(self, atomic_signature: dict, structure_signature: dict):
+    def update_signature(self, atomic_signature: dict, structure_signature: dict):
         """
-        Extend given signatures by possibly new context.
+        Extend given signatures (in place) by possibly new context.
 
         :param atomic_signature: given atomic signature
         :param structure_signature: given structure signature
-        :return: updated signatures
         """
         for agent in self.agents:
-            atomic_signature, structure_signature = agent.extend_signature(atomic_signature, structure_signature)
-        return atomic_signature, structure_signature
+            agent.update_signature(atomic_signature, structure_signature)
 
     def compatible(self, other: 'Complex'):
         """
@@ -106,7 +106,7 @@ class Complex:
             other_permutations = list(itertools.permutations(list(other_agents.elements())))
             for self_perm in itertools.permutations(list(self_agents.elements())):
                 for other_perm in other_permutations:
-                    if all([self_perm[i].compatible(other_perm[i]) for i in range(len(self_perm))]):
+                    if all(self_perm[i].compatible(other_perm[i]) for i in range(len(self_perm))):
                         return True
         return False
 
@@ -67,11 +67,12 @@ class Formula:
         :param ordering: given complex ordering of TS
         :return: unique label for each Complex and list of PRISM formulas for abstract Complexes
         """
+        index_of = {complex: i for i, complex in enumerate(ordering)}
         labels = dict()
         prism_formulas = list()
         for complex in self.get_complexes():
-            if complex in ordering:
-                labels[complex] = complex.to_PRISM_code(ordering.index(complex))
+            if complex in index_of:
+                labels[complex] = complex.to_PRISM_code(index_of[complex])
             else:
                 indices = complex.identify_compatible(ordering)
                 if not indices:
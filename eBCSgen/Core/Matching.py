@@ -0,0 +1,85 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _enumerate_indices(offsets, flat_options, counts, position, chosen):
+    """
+    Iterative depth-first enumeration of all feasible assignments of candidates to LHS complexes.
+
+    Written over plain indexable sequences so that it can be used both as it is
+    and compiled by Numba (for numpy arrays).
+
+    :param offsets: options of i-th LHS complex are flat_options[offsets[i]:offsets[i + 1]]
+    :param flat_options: concatenated indices of compatible candidates
+    :param counts: available amount of each candidate (modified during run, restored on return)
+    :param position: working buffer of length len(offsets) - 1
+    :param chosen: working buffer of length len(offsets) - 1
+    :return: list of chosen candidate indices for each match
+    """
+    out = []
+    depth = len(offsets) - 1
+    level = 0
+    position[0] = offsets[0]
+    while level >= 0:
+        if position[level] == offsets[level + 1]:
+            # all options on this level used, return to previous one
+            level -= 1
+            if level >= 0:
+                counts[chosen[level]] += 1
+                position[level] += 1
+            continue
+        candidate = flat_options[position[level]]
+        if counts[candidate] > 0:
+            chosen[level] = candidate
+            if level == depth - 1:
+                out.append(chosen.copy())
+                position[level] += 1
+            else:
+                counts[candidate] -= 1
+                level += 1
+                position[level] = offsets[level]
+        else:
+            position[level] += 1
+    return out
+
+
+if njit is not None:
+    _enumerate_indices_jit = njit(cache=True)(_enumerate_indices)
+
+
+def enumerate_matches(options: list, counts: list) -> list:
+    """
+    Enumerates all ways how LHS complexes can be assigned to candidates from a state,
+    respecting available amount of each candidate.
+
+    When Numba is available, the enumeration is compiled, otherwise it is interpreted.
+
+    :param options: for each LHS complex list of indices of compatible candidates
+    :param counts: available amount of each candidate
+    :return: list of tuples of candidate indices (one per LHS complex)
+    """
+    if not options:
+        return [()]
+    if any(len(option) == 0 for option in options):
+        return []
+
+    offsets = [0]
+    flat_options = []
+    for option in options:
+        flat_options += option
+        offsets.append(len(flat_options))
+
+    if njit is not None:
+        found = _enumerate_indices_jit(np.array(offsets, dtype=np.int64),
+                                       np.array(flat_options, dtype=np.int64),
+                                       np.array(counts, dtype=np.int64),
+                                       np.zeros(len(options), dtype=np.int64),
+                                       np.zeros(len(options), dtype=np.int64))
+        return [tuple(map(int, match)) for match in found]
+
+    found = _enumerate_indices(offsets, flat_options, list(counts), [0] * len(options), [0] * len(options))
+    return list(map(tuple, found))
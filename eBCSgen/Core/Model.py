@@ -1,4 +1,5 @@
 import collections
+import io
 import multiprocessing
 import random
 import time
@@ -31,10 +32,11 @@ class Model:
         self.regulation = regulation  # used to rules filtering, can be unspecified (None)
         
         # autocomplete
+        # signatures are never updated in place, Rule.create_all_compatible caches results per signature object
         self.atomic_signature, self.structure_signature = self.extract_signatures()
 
     def __eq__(self, other: 'Model') -> bool:
-        return set(map(hash, self.rules)) == set(map(hash, other.rules)) \
+        return set(map(str, self.rules)) == set(map(str, other.rules)) \
                and self.init == other.init and self.definitions == other.definitions
 
     def __str__(self):
@@ -42,9 +44,23 @@ class Model:
                + "\n\n" + str(self.atomic_signature) + "\n" + str(self.structure_signature) + "\n" + str(self.regulation)
 
     def __repr__(self):
-        return "#! rules\n" + "\n".join(map(str, self.rules)) + \
-               "\n\n#! inits\n" + "\n".join([str(self.init[a]) + " " + str(a) for a in self.init]) + \
-               "\n\n#! definitions\n" + "\n".join([str(p) + " = " + str(self.definitions[p]) for p in self.definitions])
+        output = io.StringIO()
+        self.write_to(output)
+        return output.getvalue()
+
+    def write_to(self, file):
+        """
+        Writes the model in BCSL syntax (as given by repr) to given file-like object.
+        Rules, initial agents, and definitions are written one by one, the whole text is never created.
+
+        :param file: given writable text file-like object
+        """
+        file.write("#! rules\n")
+        write_joined(file, map(str, self.rules))
+        file.write("\n\n#! inits\n")
+        write_joined(file, (str(self.init[a]) + " " + str(a) for a in self.init))
+        file.write("\n\n#! definitions\n")
+        write_joined(file, (str(p) + " = " + str(self.definitions[p]) for p in self.definitions))
 
     def check_rates(self) -> bool:
         """
@@ -69,13 +85,14 @@ class Model:
         """
         atomic_signature, structure_signature = dict(), dict()
         atomic_names = set()
+        add_atomic_name = atomic_names.add
         for rule in self.rules:
             for agent in rule.agents:
-                atomic_signature, structure_signature = agent.extend_signature(atomic_signature, structure_signature)
+                agent.update_signature(atomic_signature, structure_signature)
                 if type(agent) == AtomicAgent:
-                    atomic_names.add(agent.name)
-        for agent in list(self.init):
-            atomic_signature, structure_signature = agent.extend_signature(atomic_signature, structure_signature)
+                    add_atomic_name(agent.name)
+        for agent in self.init:
+            agent.update_signature(atomic_signature, structure_signature)
             atomic_names |= agent.get_atomic_names()
         for name in atomic_names:
             if name not in atomic_signature:
@@ -99,25 +116,24 @@ class Model:
         """
         Creates vector representation of the model.
 
-        First reactions are generated, then unique complexes are collected and finally both reactions and
-        initial state are transformed to vector representation.
+        First unique complexes are ordered (see create_ordering). Then, in a single pass over rules,
+        rates are vectorized and reactions are generated and directly transformed to vector representation.
+        Finally, the initial state is transformed as well.
 
         :param bound: given bound
         :return: VectorModel representation of the model
         """
         ordering = self.create_ordering()
-        reactions = set()
+        index_of = {complex: i for i, complex in enumerate(ordering)}
 
+        vector_reactions = set()
         for rule in self.rules:
-            rule_copy = copy.deepcopy(rule)
+            rule_copy = rule.clone_with_rate(copy.deepcopy(rule.rate))
             rule_copy.rate_to_vector(ordering, self.definitions)
-            reactions |= rule_copy.create_reactions(self.atomic_signature, self.structure_signature)
+            for reaction in rule_copy.create_reactions(self.atomic_signature, self.structure_signature):
+                vector_reactions.add(reaction.to_vector(ordering, self.definitions, index_of))
 
-        init = Side(self.init.elements()).to_vector(ordering)
-        vector_reactions = set()
-
-        for reaction in reactions:
-            vector_reactions.add(reaction.to_vector(ordering, self.definitions))
+        init = Side.counter_to_vector(self.init, index_of)
 
         if type(self.regulation) == Conditional:
             regulation = {k: Side(v).to_vector(ordering) for k, v in self.regulation.regulation.items()}
@@ -133,14 +149,32 @@ class Model:
 
         In the case when there are no rule present, it automatically comments out the redundant rules.
         """
+        rules = list(self.rules)
+        reactions = [rule.to_reaction() for rule in rules]
+        keys = [(side_key(reaction.lhs), side_key(reaction.rhs)) for reaction in reactions]
+
+        # compatible rules necessarily share the key of the shorter one as a prefix
+        buckets = collections.defaultdict(list)
+        for position, key in enumerate(keys):
+            buckets[key].append(position)
+
+        candidates = dict()
+        for key_left in buckets:
+            positions = []
+            for key_right, bucket in buckets.items():
+                if is_prefix(key_left[0], key_right[0]) and is_prefix(key_left[1], key_right[1]):
+                    positions += bucket
+            candidates[key_left] = sorted(positions)
+
         counter = 1
-        for rule_left in self.rules:
-            for rule_right in self.rules:
-                if id(rule_left) != id(rule_right):
-                    if rule_left.compatible(rule_right):
-                        rule_right.comment = (not self.all_rates, rule_right.comment[1] + [counter])
-                        rule_left.comment[1].append(counter)
-                        counter += 1
+        for left, reaction_left in enumerate(reactions):
+            rule_left = rules[left]
+            for right in candidates[keys[left]]:
+                if left != right and reaction_left.compatible(reactions[right]):
+                    rule_right = rules[right]
+                    rule_right.comment = (not self.all_rates, rule_right.comment[1] + [counter])
+                    rule_left.comment[1].append(counter)
+                    counter += 1
 
     def reduce_context(self):
         """
@@ -167,7 +201,7 @@ class Model:
         :param agent: given Complex agent
         :return: True if exists compatible
         """
-        return any(list(map(lambda a: a.exists_compatible_agent(agent), self.rules)))
+        return any(rule.exists_compatible_agent(agent) for rule in self.rules)
 
     def network_free_simulation(self, max_time: float):
         """
@@ -182,7 +216,6 @@ class Model:
         for rule in self.rules:
             # precompute complexes for each rule
             rule.lhs, rule.rhs = rule.create_complexes()
-            rule.rate_agents, _ = rule.rate.get_params_and_agents()
 
         time_series = dict()
         collected_agents = set(state.content.value)
@@ -264,7 +297,6 @@ class Model:
         for rule in self.rules:
             # precompute complexes for each rule
             rule.lhs, rule.rhs = rule.create_complexes()
-            rule.rate_agents, _ = rule.rate.get_params_and_agents()
 
         if bound is None:
             bound = self.compute_bound()
@@ -284,7 +316,7 @@ class Model:
         start_time = time.time()
 
         try:
-            while any([worker.work.is_set() for worker in workers]) \
+            while any(worker.work.is_set() for worker in workers) \
                     and time.time() - start_time < max_time \
                     and len(ts.states) < max_size:
                 handle_number_of_threads(len(ts.unprocessed), workers)
@@ -295,7 +327,7 @@ class Model:
         for worker in workers:
             worker.join()
 
-        while any([worker.is_alive() for worker in workers]):
+        while any(worker.is_alive() for worker in workers):
             time.sleep(1)
 
         return ts
@@ -353,3 +385,39 @@ class Model:
             unique_complexes[comp] = list(unique_complexes[comp])
 
         return unique_complexes, unique_params_from_rate
+
+
+def side_key(side: Side) -> tuple:
+    """
+    Creates a key of the Side which is shared by all compatible Sides (up to their length).
+    Compatible Complexes have the same compartment and the same names of agents.
+
+    :param side: given Side
+    :return: tuple of (compartment, sorted agent names) for each Complex
+    """
+    return tuple((complex.compartment, tuple(sorted(complex.get_agent_names()))) for complex in side.agents)
+
+
+def is_prefix(shorter: tuple, longer: tuple) -> bool:
+    """
+    Checks whether the first tuple is a prefix of the second one.
+
+    :param shorter: given tuple
+    :param longer: given tuple
+    :return: True if prefix
+    """
+    return longer[:len(shorter)] == shorter
+
+
+def write_joined(file, items, separator: str = "\n"):
+    """
+    Writes given strings separated by separator to given file-like object (as separator.join would).
+
+    :param file: given writable text file-like object
+    :param items: iterable of strings
+    :param separator: string written between consecutive items
+    """
+    for i, item in enumerate(items):
+        if i:
+            file.write(separator)
+        file.write(item)
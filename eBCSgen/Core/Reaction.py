@@ -35,18 +35,21 @@ class Reaction:
     def __hash__(self):
         return hash((self.lhs, self.rhs, self.rate))
 
-    def to_vector(self, ordering: SortedList, definitions: dict) -> VectorReaction:
+    def to_vector(self, ordering: SortedList, definitions: dict, index_of: dict = None) -> VectorReaction:
         """
         Creates vector representation of the Reaction.
 
         :param ordering: given fixed order of unique Complexes
         :param definitions: dict of (param_name, value)
+        :param index_of: optional precomputed mapping of Complex to its position in ordering
         :return: VectorReaction representation of Reaction
         """
-        return VectorReaction(self.lhs.to_vector(ordering),
-                              self.rhs.to_vector(ordering),
-                              self.rate,
-                              self.label)
+        if index_of is None:
+            lhs, rhs = self.lhs.to_vector(ordering), self.rhs.to_vector(ordering)
+        else:
+            lhs = Side.counter_to_vector(self.lhs.to_counter(), index_of)
+            rhs = Side.counter_to_vector(self.rhs.to_counter(), index_of)
+        return VectorReaction(lhs, rhs, self.rate, self.label)
 
     def compatible(self, other: 'Reaction') -> bool:
         """
@@ -2,18 +2,16 @@ import collections
 import itertools
 import random
 from copy import copy, deepcopy
+from operator import itemgetter
 
 from eBCSgen.Core.Rate import Rate
 from eBCSgen.Core.Complex import Complex
 from eBCSgen.Core.Side import Side
 from eBCSgen.Core.Reaction import Reaction
+from eBCSgen.Core.Matching import enumerate_matches
 from eBCSgen.TS.State import Multiset
 
 
-def column(lst, index):
-    return tuple(map(lambda x: x[index], lst))
-
-
 class Rule:
     def __init__(
         self,
@@ -43,6 +41,27 @@ class Rule:
         self.rate = rate
         self.label = label
         self.comment = (False, [])
+        # Sides of the Rule, computed lazily by to_reaction
+        self._sides = None
+
+        # agents used in rate and their compatibility with state complexes, computed lazily by evaluate_rate
+        # for the Rate object stored in _rate_agents_source (rebuilt when self.rate is replaced)
+        self.rate_agents = None
+        self._rate_agents_source = None
+        self._compatible_rate_agents = dict()
+
+        # result of create_all_compatible together with the signatures it was computed for
+        self._all_compatible = None
+
+        # hash of the fields which are not modified after construction, label and rate are hashed
+        # on demand because they can be replaced (see create_reversible and Model.check_rates)
+        self._structure_hash = self.create_structure_hash()
+
+        # slice bounds and compartment of each complex, split by side
+        self._lhs_layout, self._rhs_layout = [], []
+        for f, t in complexes:
+            layout = self._lhs_layout if t < mid else self._rhs_layout
+            layout.append((f, t + 1, compartments[f]))
 
     def __eq__(self, other: "Rule"):
         return (
@@ -84,7 +103,26 @@ class Rule:
         return str(self) < str(other)
 
     def __hash__(self):
-        return hash(str(self))
+        return hash((self._structure_hash, self.label, str(self.rate) if self.rate else None))
+
+    def __getstate__(self):
+        # string hashes are salted per process, the structure hash is recomputed on unpickling
+        state = self.__dict__.copy()
+        del state["_structure_hash"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._structure_hash = self.create_structure_hash()
+
+    def create_structure_hash(self) -> int:
+        """
+        Computes hash of the fields which do not change after construction of the Rule.
+
+        :return: hash of agents, mid, compartments, complexes, and pairs
+        """
+        return hash((self.agents, self.mid, tuple(self.compartments),
+                     tuple(map(tuple, self.complexes)), tuple(map(tuple, self.pairs))))
 
     def get_unique_complexes_from_rule(self) -> dict:
         """
@@ -94,24 +132,25 @@ class Rule:
         :return: dict of {Complexes:{SBML codes of all isomorphisms in set}}
         """
         unique_complexes_from_rule = dict()
-        for f, t in self.complexes:
-            c = Complex(self.agents[f : t + 1], self.compartments[f])
+        for f, t, compartment in self._lhs_layout + self._rhs_layout:
+            c = Complex(self.agents[f:t], compartment)
             double = (c, c.to_SBML_species_code())
             unique_complexes_from_rule[c] = unique_complexes_from_rule.get(c, set()) | {
                 double
             }
         return unique_complexes_from_rule
 
-    def create_complexes(self):
+    def create_complexes(self, agents: tuple = None):
         """
         Creates left- and right-hand sides of rule as multisets of Complexes.
 
+        :param agents: agents to be used instead of self.agents (e.g. with added context)
         :return: two multisets of Complexes represented as object Side
         """
-        lhs, rhs = [], []
-        for f, t in self.complexes:
-            c = Complex(self.agents[f : t + 1], self.compartments[f])
-            lhs.append(c) if t < self.mid else rhs.append(c)
+        if agents is None:
+            agents = self.agents
+        lhs = [Complex(agents[f:t], compartment) for f, t, compartment in self._lhs_layout]
+        rhs = [Complex(agents[f:t], compartment) for f, t, compartment in self._rhs_layout]
         return Side(lhs), Side(rhs)
 
     def to_reaction(self) -> Reaction:
@@ -119,11 +158,38 @@ class Rule:
         Converts Rule to Reactions -> complicated rule structure is simplified to multiset (resp. Side)
         representation of both sides.
 
+        Sides depend only on agents and their structure which do not change,
+        so they are created only once and shared by all produced Reactions.
+
         :return: created Reaction
         """
-        lhs, rhs = self.create_complexes()
+        if self._sides is None:
+            self._sides = self.create_complexes()
+        lhs, rhs = self._sides
         return Reaction(lhs, rhs, copy(self.rate), self.label)
 
+    def clone_with_rate(self, rate: Rate) -> "Rule":
+        """
+        Creates a copy of the Rule with given Rate.
+        All other (not modified) attributes are shared with the original Rule.
+
+        :param rate: Rate of the new Rule
+        :return: new Rule
+        """
+        rule = Rule(
+            self.agents,
+            self.mid,
+            self.compartments,
+            self.complexes,
+            self.pairs,
+            rate,
+            self.label,
+        )
+        rule.comment = self.comment
+        rule._sides = self._sides
+        rule._all_compatible = self._all_compatible
+        return rule
+
     def rate_to_vector(self, ordering, definitions: dict):
         """
         Converts all occurrences of Complexes in rate to vector representation.
@@ -145,7 +211,7 @@ class Rule:
         :param structure_signature: given mapping of structure name to possible atomics
         :return: set of created reactions
         """
-        unique_lhs_indices = set(column(self.pairs, 0))
+        unique_lhs_indices = set(map(itemgetter(0), self.pairs))
         if (
             len(self.pairs) > 1
             and len(unique_lhs_indices) == 1
@@ -180,16 +246,8 @@ class Rule:
             # replicate RHS agent n times
             for _ in range(len(self.pairs)):
                 new_agents.append(deepcopy(new_agents[-1]))
-            new_rule = Rule(
-                tuple(new_agents),
-                self.mid,
-                self.compartments,
-                self.complexes,
-                self.pairs,
-                self.rate,
-                self.label,
-            )
-            reactions.add(new_rule.to_reaction())
+            lhs, rhs = self.create_complexes(tuple(new_agents))
+            reactions.add(Reaction(lhs, rhs, copy(self.rate), self.label))
 
         return reactions
 
@@ -198,7 +256,7 @@ class Rule:
     ) -> set:
         """
         Adds context to all agents and generated all possible combinations.
-        Then, new rules with these enhances agents are generated and converted to Reactions.
+        Then, Reactions are created directly from these enhanced agents.
 
         :param atomic_signature: given mapping of atomic name to possible states
         :param structure_signature: given mapping of structure name to possible atomics
@@ -221,17 +279,10 @@ class Rule:
 
         reactions = set()
         for result in itertools.product(*results):
-            new_agents = tuple(filter(None, column(result, 0) + column(result, 1)))
-            new_rule = Rule(
-                new_agents,
-                self.mid,
-                self.compartments,
-                self.complexes,
-                self.pairs,
-                self.rate,
-                self.label,
-            )
-            reactions.add(new_rule.to_reaction())
+            lefts, rights = zip(*result)
+            new_agents = tuple(agent for agent in itertools.chain(lefts, rights) if agent is not None)
+            lhs, rhs = self.create_complexes(new_agents)
+            reactions.add(Reaction(lhs, rhs, copy(self.rate), self.label))
 
         return reactions
 
@@ -287,15 +338,24 @@ class Rule:
 
     def create_all_compatible(self, atomic_signature: dict, structure_signature: dict):
         """
-        Creates all fully specified complexes for all both Sides
+        Creates all fully specified complexes for all both Sides.
+        The result is remembered for the last given signatures (compared by identity),
+        therefore the signatures must not be modified in place after this call
+        (e.g. by update_signature) - new dicts have to be created instead.
 
         :param atomic_signature: given atomic signature
         :param structure_signature: given structure signature
-        :return: set of all created Complexes
+        :return: set of all created Complexes (shared, must not be modified)
         """
-        return self.to_reaction().create_all_compatible(
+        if self._all_compatible is not None:
+            cached_atomic, cached_structure, complexes = self._all_compatible
+            if cached_atomic is atomic_signature and cached_structure is structure_signature:
+                return complexes
+        complexes = self.to_reaction().create_all_compatible(
             atomic_signature, structure_signature
         )
+        self._all_compatible = (atomic_signature, structure_signature, complexes)
+        return complexes
 
     def evaluate_rate(self, state, params):
         """
@@ -305,11 +365,22 @@ class Rule:
         :param params: mapping of params to its value
         :return: a real number of the rate
         """
+        if self.rate_agents is None or self._rate_agents_source is not self.rate:
+            agents, _ = self.rate.get_params_and_agents()
+            self.rate_agents = tuple(agents)
+            self._rate_agents_source = self.rate
+            self._compatible_rate_agents = dict()
+
         values = dict()
         for state_complex, count in state.content.value.items():
-            for agent in self.rate_agents:
-                if agent.compatible(state_complex):
-                    values[agent] = values.get(agent, 0) + count
+            compatible_agents = self._compatible_rate_agents.get(state_complex)
+            if compatible_agents is None:
+                compatible_agents = tuple(
+                    agent for agent in self.rate_agents if agent.compatible(state_complex)
+                )
+                self._compatible_rate_agents[state_complex] = compatible_agents
+            for agent in compatible_agents:
+                values[agent] = values.get(agent, 0) + count
         return self.rate.evaluate_direct(values, params)
 
     def match(self, state, all=False):
@@ -320,8 +391,7 @@ class Rule:
         :param all: bool to indicate if choose one matching randomly or return all of them
         :return: random match/all matches
         """
-        state = deepcopy(state.content.value)
-        matches = find_all_matches(self.lhs.agents, state)
+        matches = find_all_matches(self.lhs.agents, state.content.value)
         matches = [sum(match, []) for match in matches]
 
         if len(matches) == 0:
@@ -340,7 +410,7 @@ class Rule:
         """
         # replace respective agents
 
-        unique_lhs_indices = set(column(self.pairs, 0))
+        unique_lhs_indices = set(map(itemgetter(0), self.pairs))
         if (
             len(self.pairs) > 1
             and len(unique_lhs_indices) == 1
@@ -353,11 +423,9 @@ class Rule:
 
         # construct resulting complexes
         output_complexes = []
-        for f, t in list(filter(lambda item: item[0] >= self.mid, self.complexes)):
+        for f, t, compartment in self._rhs_layout:
             output_complexes.append(
-                Complex(
-                    resulting_rhs[f - self.mid : t - self.mid + 1], self.compartments[f]
-                )
+                Complex(resulting_rhs[f - self.mid : t - self.mid], compartment)
             )
 
         return Multiset(collections.Counter(output_complexes))
@@ -401,8 +469,8 @@ class Rule:
         :return: multiset of constructed agents
         """
         output_complexes = []
-        for f, t in list(filter(lambda item: item[1] < self.mid, self.complexes)):
-            output_complexes.append(Complex(match[f : t + 1], self.compartments[f]))
+        for f, t, compartment in self._lhs_layout:
+            output_complexes.append(Complex(match[f:t], compartment))
         return Multiset(collections.Counter(output_complexes))
 
     def create_reversible(self, rate: Rate = None):
@@ -443,20 +511,26 @@ def find_all_matches(lhs_agents, state):
     """
     Finds all possible matches which actually can be used for given state.
 
+    Candidates from the state are encoded as integers first, compatibility with LHS complexes
+    is checked only once per pair, and the enumeration itself runs over integer indices
+    (see eBCSgen.Core.Matching). The given state is not modified.
+
     :param lhs_agents: given LHS of a rule
-    :param state: state to be applied to
+    :param state: state to be applied to (Counter of Complex -> count)
     :return: candidates for match
     """
+    candidates = [candidate for candidate in state if state[candidate] > 0]
+    counts = [state[candidate] for candidate in candidates]
+
+    options, aligns = [], []
+    for lhs_complex in lhs_agents:
+        compatible = [i for i, candidate in enumerate(candidates) if lhs_complex.compatible(candidate)]
+        options.append(compatible)
+        aligns.append({i: candidates[i].align_match(lhs_complex) for i in compatible})
+
     choices = []
-    if len(lhs_agents) == 0:
-        return [choices]
-
-    lhs_complex = lhs_agents[0]
-    for candidate in list(state):
-        if lhs_complex.compatible(candidate):
-            state[candidate] -= 1
-            aligns = candidate.align_match(lhs_complex)
-            for branch in find_all_matches(lhs_agents[1:], deepcopy(+state)):
-                for align in aligns:
-                    choices.append([align] + branch)
+    for match in enumerate_matches(options, counts):
+        alignments = [aligns[level][candidate] for level, candidate in enumerate(match)]
+        for aligned in itertools.product(*alignments):
+            choices.append(list(aligned))
     return choices
@@ -16,6 +16,8 @@ class Side:
         self.agents = agents
 
     def __eq__(self, other: 'Side'):
+        if self is other:
+            return True
         return self.to_counter() == other.to_counter()
 
     def __repr__(self):
@@ -57,6 +59,21 @@ class Side:
             vector[ordering.index(agent)] = multiset[agent]
         return State(Vector(vector), Memory(0))
 
+    @staticmethod
+    def counter_to_vector(counter: collections.Counter, index_of: dict) -> State:
+        """
+        Convert a multiset of Complexes directly to a VectorState, without expanding its elements.
+
+        :param counter: given multiset of Complexes
+        :param index_of: mapping of Complex to its position in the ordering
+        :return: VectorState representing vector
+        """
+        vector = np.zeros(len(index_of), dtype=int)
+        for agent, count in counter.items():
+            if count > 0:
+                vector[index_of[agent]] = count
+        return State(Vector(vector), Memory(0))
+
     def compatible(self, other: 'Side') -> bool:
         """
         Checks whether two Sides are compatible.
@@ -69,7 +86,7 @@ class Side:
         """
         if len(self) > len(other):
             return False
-        return all([self.agents[i].compatible(other.agents[i]) for i in range(len(self))])
+        return all(self.agents[i].compatible(other.agents[i]) for i in range(len(self)))
 
     def exists_compatible_agent(self, agent: Complex) -> bool:
         """
@@ -78,7 +95,7 @@ class Side:
         :param agent: given Complex agent
         :return: True if exists compatible
         """
-        return any(list(map(lambda a: a.compatible(agent), self.agents)))
+        return any(a.compatible(agent) for a in self.agents)
 
     def create_all_compatible(self, atomic_signature: dict, structure_signature: dict):
         """
@@ -49,21 +49,17 @@ class StructureAgent:
                 return False
         return True
 
-    def extend_signature(self, atomic_signature: dict, structure_signature: dict):
+    def update_signature(self, atomic_signature: dict, structure_signature: dict):
         """
-        Extend given signatures by possibly new context.
+        Extend given signatures (in place) by possibly new context.
 
         :param atomic_signature: given atomic signature
         :param structure_signature: given structure signature
-        :return: updated signatures
         """
-        if not self.composition:
-            structure_signature[self.name] = structure_signature.get(self.name, set())
-        else:
-            for atomic in self.composition:
-                structure_signature[self.name] = structure_signature.get(self.name, set()) | {atomic.name}
-                atomic_signature, structure_signature = atomic.extend_signature(atomic_signature, structure_signature)
-        return atomic_signature, structure_signature
+        names = structure_signature.setdefault(self.name, set())
+        for atomic in self.composition:
+            names.add(atomic.name)
+            atomic.update_signature(atomic_signature, structure_signature)
 
     def add_context(self, other, atomic_signature: dict, structure_signature: dict) -> set:
         """
@@ -86,8 +82,8 @@ class StructureAgent:
             if structure_signature[self.name] - present_atomics != set():
                 result = []
                 for atomic_name in structure_signature[self.name] - present_atomics:
-                    possibilities = AtomicAgent(atomic_name, "_").add_context(AtomicAgent(atomic_name, "_"),
-                                                                              atomic_signature, structure_signature)
+                    possibilities = AtomicAgent.get(atomic_name, "_").add_context(AtomicAgent.get(atomic_name, "_"),
+                                                                                  atomic_signature, structure_signature)
                     result.append(possibilities)
                 agents = set()
                 for options in itertools.product(*result):
@@ -104,7 +100,7 @@ class StructureAgent:
         if structure_signature[self.name] - present_atomics != set():
             result = []
             for atomic_name in structure_signature[self.name] - present_atomics:
-                possibilities = AtomicAgent(atomic_name, "_").add_context(1, atomic_signature, structure_signature)
+                possibilities = AtomicAgent.get(atomic_name, "_").add_context(1, atomic_signature, structure_signature)
                 result.append(possibilities)
             agents = set()
             for options in itertools.product(*result):
@@ -1,4 +1,5 @@
 import collections
+import functools
 import json
 import numpy as np
 from numpy import inf
@@ -767,24 +768,38 @@ class TreeToObjects(Transformer):
         return Model(rules, inits, definitions, params, regulation)
 
 
+@functools.lru_cache(maxsize=None)
+def create_lark_parser(start: str) -> Lark:
+    """
+    Compiles BCSL grammar with given start symbol.
+
+    Grammar compilation is expensive and the resulting parser keeps no state
+    between parse calls, hence it is created only once per start symbol and shared.
+
+    :param start: start symbol of the grammar
+    :return: compiled Lark parser
+    """
+    grammar = (
+        "start: "
+        + start
+        + GRAMMAR
+        + COMPLEX_GRAMMAR
+        + EXTENDED_GRAMMAR
+        + REGULATIONS_GRAMMAR
+        + REGEX_GRAMMAR
+        + OBSERVABLES_GRAMMAR
+    )
+    return Lark(
+        grammar,
+        parser="earley",
+        propagate_positions=False,
+        maybe_placeholders=False,
+    )
+
+
 class Parser:
     def __init__(self, start):
-        grammar = (
-            "start: "
-            + start
-            + GRAMMAR
-            + COMPLEX_GRAMMAR
-            + EXTENDED_GRAMMAR
-            + REGULATIONS_GRAMMAR
-            + REGEX_GRAMMAR
-            + OBSERVABLES_GRAMMAR
-        )
-        self.parser = Lark(
-            grammar,
-            parser="earley",
-            propagate_positions=False,
-            maybe_placeholders=False,
-        )
+        self.parser = create_lark_parser(start)
 
         self.terminals = dict((v, k) for k, v in _TERMINAL_NAMES.items())
         self.terminals.update(
@@ -5,6 +5,7 @@ from lark.load_grammar import _TERMINAL_NAMES
 from eBCSgen.Core.Formula import Formula, AtomicProposition
 from eBCSgen.Parsing.ParseBCSL import COMPLEX_GRAMMAR
 from eBCSgen.Parsing.ParseBCSL import TreeToComplex
+from eBCSgen.utils import lark_cache_file
 
 GRAMMAR = """
     start: state_formula
@@ -95,7 +96,8 @@ class PCTLparser:
         self.parser = Lark(grammar, parser='lalr',
                            propagate_positions=False,
                            maybe_placeholders=False,
-                           transformer=TreeToComplex()
+                           transformer=TreeToComplex(),
+                           cache=lark_cache_file("pctl")
                            )
 
         self.terminals = dict((v, k) for k, v in _TERMINAL_NAMES.items())
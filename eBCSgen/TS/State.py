@@ -119,13 +119,13 @@ class Multiset:
         return Multiset(self.value + other.value)
 
     def __ge__(self, other: 'Multiset') -> bool:
-        return all([self.value[agent] >= other.value.get(agent, 0) for agent in self.value])
+        return all(self.value[agent] >= other.value.get(agent, 0) for agent in self.value)
 
     def __hash__(self):
         return hash(frozenset(self.value.items()))
 
     def validate_bound(self, bound):
-        return all([self.value[agent] <= bound for agent in self.value])
+        return all(self.value[agent] <= bound for agent in self.value)
 
     def set_hell(self):
         self.value = collections.Counter()
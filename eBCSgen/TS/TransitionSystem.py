@@ -8,6 +8,10 @@ from pyModelChecking import Kripke
 from eBCSgen.TS.State import State, Memory, Vector
 
 
+AP_COMPARISONS = {"=": np.equal, "==": np.equal, "<": np.less, "<=": np.less_equal,
+                  ">": np.greater, ">=": np.greater_equal}
+
+
 class TransitionSystem:
     def __init__(self, ordering: SortedList = None, bound=None):
         self.ordering = ordering  # used to decode State to actual agents
@@ -155,14 +159,44 @@ class TransitionSystem:
             AP_lables[ap] = "property_" + str(len(AP_lables))
 
         state_labels = dict()
-        for key, state in self.states_encoding.items():
+        keys = list(self.states_encoding)
+        if keys:
+            # states as rows of a single matrix, hell states are never satisfying any AP
+            matrix = np.array([self.states_encoding[key].content.value for key in keys], dtype=float)
+            hell = np.array([self.states_encoding[key].is_hell for key in keys])
+            matrix[hell] = 0
+            index_of = {complex: i for i, complex in enumerate(self.ordering)}
+
             for ap in APs:
-                if state.check_AP(ap, self.ordering):
+                compare = AP_COMPARISONS.get(ap.sign.strip())
+                if compare is None:
+                    satisfied = [self.states_encoding[key].check_AP(ap, self.ordering) for key in keys]
+                else:
+                    satisfied = compare(matrix @ self.AP_coefficients(ap, index_of), float(ap.number)) & ~hell
+                for position in np.nonzero(satisfied)[0]:
+                    key = keys[position]
                     state_labels[key] = state_labels.get(key, set()) | {AP_lables[ap]}
         if include_init:
             state_labels[self.init] = state_labels.get(self.init, set()) | {"init"}
         return state_labels, AP_lables
 
+    def AP_coefficients(self, ap, index_of: dict) -> np.array:
+        """
+        Creates vector of coefficients such that its dot product with a State vector
+        gives the amount of the Complex from given AtomicProposition.
+        For abstract Complexes, amounts of all compatible Complexes are summed.
+
+        :param ap: given AtomicProposition
+        :param index_of: mapping of Complex to its position in ordering
+        :return: coefficients as np.array
+        """
+        coefficients = np.zeros(len(self.ordering))
+        if ap.complex in index_of:
+            coefficients[index_of[ap.complex]] = 1
+        else:
+            coefficients[ap.complex.identify_compatible(self.ordering)] = 1
+        return coefficients
+
     def change_to_vector_backend(self):
         """
         Changes backend from Multisets to Vectors by encoding them.
@@ -184,20 +218,16 @@ class TransitionSystem:
         :param labels_file: file for labels
         :param labels: labels representing atomic propositions assigned to states
         """
-        trans_file = open(transitions_file, "w+")
-        trans_file.write("dtmc\n")
+        with open(transitions_file, "w+") as trans_file:
+            trans_file.write("dtmc\n")
+            trans_file.writelines(str(edge) + "\n" for edge in sorted(self.edges))
 
-        for edge in sorted(self.edges):
-            trans_file.write(str(edge) + "\n")
-        trans_file.close()
+        with open(labels_file, "w+") as label_file:
+            unique_labels = ['init'] + list(map(str, AP_labels.values()))
+            label_file.write("#DECLARATION\n" + " ".join(unique_labels) + "\n#END\n")
 
-        label_file = open(labels_file, "w+")
-        unique_labels = ['init'] + list(map(str, AP_labels.values()))
-        label_file.write("#DECLARATION\n" + " ".join(unique_labels) + "\n#END\n")
-
-        label_file.write("\n".join([str(state) + " " + " ".join(list(map(str, state_labels[state])))
-                                    for state in sorted(state_labels)]))
-        label_file.close()
+            label_file.write("\n".join([str(state) + " " + " ".join(list(map(str, state_labels[state])))
+                                        for state in sorted(state_labels)]))
 
     def save_to_prism(self, output_file: str, params: set, prism_formulas: list):
         """
@@ -208,33 +238,31 @@ class TransitionSystem:
         :param prism_formulas: definition of abstract Complexes
         """
 
-        prism_file = open(output_file, "w+")
-        prism_file.write("dtmc\n")
-
-        # declare parameters
-        prism_file.write("\n" + "\n".join(["\tconst double {};".format(param) for param in params]) + "\n")
-        prism_file.write("\nmodule TS\n")
+        with open(output_file, "w+") as prism_file:
+            prism_file.write("dtmc\n")
 
-        # to get rid of inf
-        self.change_hell()
+            # declare parameters
+            prism_file.write("\n" + "\n".join(["\tconst double {};".format(param) for param in params]) + "\n")
+            prism_file.write("\nmodule TS\n")
 
-        # declare state variables
-        init = self.states_encoding[self.init]
-        vars = ['\tVAR_{} : [0..{}] init {}; // {}'.format(i, self.bound + 1, int(init.content.value[i]), self.ordering[i])
-                for i in range(len(self.ordering))]
-        prism_file.write("\n" + "\n".join(vars) + "\n")
+            # to get rid of inf
+            self.change_hell()
 
-        # write transitions
-        transitions = self.edges_to_PRISM(self.states_encoding)
-        prism_file.write("\n" + "\n".join(transitions))
+            # declare state variables
+            init = self.states_encoding[self.init]
+            vars = ['\tVAR_{} : [0..{}] init {}; // {}'.format(i, self.bound + 1, int(init.content.value[i]), self.ordering[i])
+                    for i in range(len(self.ordering))]
+            prism_file.write("\n" + "\n".join(vars) + "\n")
 
-        prism_file.write("\nendmodule\n\n")
+            # write transitions
+            transitions = self.edges_to_PRISM(self.states_encoding)
+            prism_file.write("\n" + "\n".join(transitions))
 
-        # write formulas
-        if prism_formulas:
-            prism_file.write("\n\tformula " + "\n".join(prism_formulas))
+            prism_file.write("\nendmodule\n\n")
 
-        prism_file.close()
+            # write formulas
+            if prism_formulas:
+                prism_file.write("\n\tformula " + "\n".join(prism_formulas))
 
     def edges_to_PRISM(self, decoding):
         """
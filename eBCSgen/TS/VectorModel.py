@@ -207,7 +207,7 @@ class VectorModel:
         start_time = time.time()
 
         try:
-            while any([worker.work.is_set() for worker in workers]) \
+            while any(worker.work.is_set() for worker in workers) \
                     and time.time() - start_time < max_time \
                     and len(ts.states) + len(ts.states_encoding) < max_size:
                 handle_number_of_threads(len(ts.unprocessed), workers)
@@ -220,7 +220,7 @@ class VectorModel:
         for worker in workers:
             worker.join()
 
-        while any([worker.is_alive() for worker in workers]):
+        while any(worker.is_alive() for worker in workers):
             time.sleep(1)
 
         ts.encode()
@@ -1,3 +1,5 @@
+import os
+
 from lark import Tree
 
 
@@ -12,3 +14,23 @@ def tree_to_string(tree):
         return sum(list(map(tree_to_string, tree.children)), [])
     else:
         return [str(tree)]
+
+
+def lark_cache_file(name: str):
+    """
+    Creates path for Lark to store compiled grammar with given name in.
+    The file is placed in a cache directory accessible only by the current user
+    (unlike Lark's default location in shared temporary directory).
+
+    :param name: given grammar name
+    :return: path of the cache file or False if the cache directory is not available
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    directory = os.path.join(cache_home, "ebcsgen")
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+    except OSError:
+        return False
+    if not os.access(directory, os.W_OK):
+        return False
+    return os.path.join(directory, name + ".lark")